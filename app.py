@@ -1,7 +1,7 @@
 """Streamlit app for Murayama tunnel stability analysis."""
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import plotly.io as pio
 from src.models import (
     TunnelGeometry, SoilParameters, LoadingConditions, 
     MurayamaInput, MurayamaResult, SurchargeMethod
@@ -10,11 +10,16 @@ from src.murayama_new import ImprovedMurayamaCalculator
 from src.murayama import get_default_presets
 from src.report_generator import ReportGenerator, generate_markdown_report
 from src.convergence_utils import (
-    show_calculation_progress, 
+    show_calculation_progress,
+    create_convergence_plot,
     create_convergence_history_plot,
     create_convergence_statistics_plot,
     create_convergence_summary_table
 )
+from src.animation_utils import (
+    build_animation_json,
+    render_slip_surface_animation
+)
 import io
 import base64
 from datetime import datetime
@@ -385,6 +390,9 @@ if page == "計算":
                 # Store result in session state
                 st.session_state['result'] = result
                 st.session_state['input'] = murayama_input
+                # Drop any figure JSON cached for the previous result
+                st.session_state.pop('px_fig_json', None)
+                st.session_state.pop('anim_fig_json', None)
         
         # Display results if available
         if 'result' in st.session_state:
@@ -466,47 +474,43 @@ if page == "計算":
                     st.session_state.show_graph = not st.session_state.show_graph
             
             # Additional analysis buttons
-            col_btn1, col_btn2 = st.columns(2)
+            col_btn1, col_btn2, col_btn3 = st.columns(3)
             with col_btn1:
                 if st.button("📊 収束履歴", use_container_width=True):
                     st.session_state.show_convergence = True
-            
+
             with col_btn2:
                 if st.button("📋 収束統計", use_container_width=True):
                     st.session_state.show_statistics = True
+
+            with col_btn3:
+                if st.button("🎬 アニメーション", use_container_width=True):
+                    st.session_state.show_animation = True
             
             # P-x curve graph
             if st.session_state.show_graph:
                 st.markdown("#### P-x曲線（必要支保圧力分布）")
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=result.x_values,
-                    y=result.P_values,
-                    mode='lines',
-                    name='P-x曲線',
-                    line=dict(color='blue', width=2)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=[result.x_critical],
-                    y=[result.P_max],
-                    mode='markers',
-                    name=f'P_max = {result.P_max:.1f} kN/m²',
-                    marker=dict(color='red', size=12, symbol='star')
-                ))
-                fig.update_layout(
-                    xaxis_title="すべり面始点位置 x (m)",
-                    yaxis_title="必要支保圧力 P (kN/m²)",
-                    plot_bgcolor='white',
-                    hovermode='x unified'
+                # Serialize the figure once per result; reruns re-render
+                # from the cached JSON instead of rebuilding the figure
+                if 'px_fig_json' not in st.session_state:
+                    fig = create_convergence_plot(
+                        result.x_values,
+                        result.P_values,
+                        result.x_critical,
+                        result.P_max
+                    )
+                    st.session_state['px_fig_json'] = pio.to_json(fig)
+                st.plotly_chart(
+                    pio.from_json(st.session_state['px_fig_json']),
+                    use_container_width=True
                 )
-                st.plotly_chart(fig, use_container_width=True)
             
             # Convergence history
             if st.session_state.get('show_convergence', False):
                 st.markdown("#### 📊 反復計算の収束履歴")
                 if result.convergence_info and 'convergence_sample' in result.convergence_info:
                     convergence_sample = result.convergence_info['convergence_sample']
-                    if convergence_sample:
+                    if convergence_sample is not None and len(convergence_sample) > 0:
                         fig_conv = create_convergence_history_plot(
                             convergence_sample,
                             murayama_input.tolerance
@@ -540,28 +544,30 @@ if page == "計算":
                 if st.button("収束統計を閉じる"):
                     st.session_state.show_statistics = False
                     st.rerun()
-                fig.add_trace(go.Scatter(
-                    x=result.x_values,
-                    y=result.P_values,
-                    mode='lines',
-                    name='P-x曲線',
-                    line=dict(color='blue', width=2)
-                ))
-                fig.add_trace(go.Scatter(
-                    x=[result.x_critical],
-                    y=[result.P_max],
-                    mode='markers',
-                    name=f'P_max = {result.P_max:.1f} kN/m²',
-                    marker=dict(color='red', size=12, symbol='star')
-                ))
-                fig.update_layout(
-                    xaxis_title="すべり面始点位置 x [m]",
-                    yaxis_title="必要支保圧力 P [kN/m²]",
-                    height=300,
-                    margin=dict(l=0, r=0, t=20, b=0)
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
+
+            # Slip surface search animation
+            if st.session_state.get('show_animation', False):
+                st.markdown("#### 🎬 すべり面の探索アニメーション")
+                frames = result.convergence_info.get('animation_frames') if result.convergence_info else None
+                if frames is not None and len(frames) > 0:
+                    # Build and serialize the figure once per result;
+                    # reruns re-render from the cached JSON
+                    if 'anim_fig_json' not in st.session_state:
+                        st.session_state['anim_fig_json'] = build_animation_json(
+                            frames,
+                            input_params.geometry.height,
+                            input_params.geometry.tunnel_depth
+                        )
+                    render_slip_surface_animation(
+                        pio.from_json(st.session_state['anim_fig_json'])
+                    )
+                else:
+                    st.info("アニメーションデータがありません")
+
+                if st.button("アニメーションを閉じる"):
+                    st.session_state.show_animation = False
+                    st.rerun()
+
         else:
             # Show placeholder message
             st.info("💡 左側のパラメータを入力して「計算実行」をクリックしてください")
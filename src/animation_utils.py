@@ -0,0 +1,176 @@
+"""Utilities for slip surface animation and visualization."""
+import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
+import streamlit.components.v1 as components
+
+from src.murayama_new import FRAME_DTYPE  # noqa: F401 - re-export for consumers
+
+
+# Normalized parameter for slip surface sampling; the trace shape is
+# fixed at 50 points, so interpolate against this module-level scratch
+# instead of allocating two linspaces per call
+_T50 = np.linspace(0.0, 1.0, 50)
+
+
+def create_slip_surface_trace(frame: np.void, name: str = "すべり面",
+                              color: str = "blue", width: int = 2) -> go.Scatter:
+    """
+    Create a scatter trace for a single slip surface record.
+
+    Args:
+        frame: One FRAME_DTYPE record
+        name: Trace name shown in the legend
+        color: Line color
+        width: Line width
+
+    Returns:
+        Plotly scatter trace following the logarithmic spiral
+    """
+    theta_d = frame['theta_d']
+    r_d = frame['r_d']
+    theta_array = theta_d + (frame['theta_i'] - theta_d) * _T50
+    r_array = r_d + (frame['r_i'] - r_d) * _T50
+
+    x = frame['Ox'] + r_array * np.cos(theta_array)
+    y = frame['Oy'] + r_array * np.sin(theta_array)
+
+    return go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        name=name,
+        line=dict(color=color, width=width)
+    )
+
+
+def create_slip_surface_animation(frames_arr: np.ndarray,
+                                  height: float, tunnel_depth: float) -> go.Figure:
+    """
+    Create an animated figure sweeping through candidate slip surfaces.
+
+    Each frame carries only its trace data (no layout payload), so playback
+    re-sends `data` deltas without re-syncing the figure layout. All styling
+    is applied once to the initial layout.
+
+    Args:
+        frames_arr: FRAME_DTYPE structured array, one record per candidate
+        height: Tunnel face height H [m]
+        tunnel_depth: Tunnel crown depth D_t [m]
+
+    Returns:
+        Plotly figure with frames and playback controls
+    """
+    fig = go.Figure()
+
+    if frames_arr is None or len(frames_arr) == 0:
+        return fig
+
+    # Trace 0: animated slip surface (updated in-place by each frame)
+    fig.add_trace(create_slip_surface_trace(frames_arr[0]))
+
+    # Trace 1: tunnel face (static)
+    fig.add_trace(go.Scatter(
+        x=[0, 0],
+        y=[tunnel_depth, tunnel_depth + height],
+        mode='lines',
+        name='切羽',
+        line=dict(color='black', width=3)
+    ))
+
+    # Data-only frames: update trace 0, never touch layout
+    frames = []
+    steps = []
+    for rec in frames_arr:
+        frame_name = f"{rec['x_i']:.2f}"
+        color = 'red' if rec['is_crit'] else 'blue'
+        frames.append(go.Frame(
+            data=[create_slip_surface_trace(rec, color=color)],
+            traces=[0],
+            layout=None,
+            name=frame_name
+        ))
+        steps.append(dict(
+            method='animate',
+            args=[[frame_name], {'frame': {'duration': 0, 'redraw': False},
+                                 'mode': 'immediate',
+                                 'transition': {'duration': 0}}],
+            label=frame_name
+        ))
+
+    fig.frames = frames
+
+    # Styling lives only in the initial layout; frames never re-sync it
+    fig.update_layout(
+        title="すべり面の探索アニメーション",
+        xaxis_title="水平距離 x (m)",
+        yaxis_title="深さ y (m)",
+        yaxis=dict(scaleanchor='x', scaleratio=1),
+        plot_bgcolor='white',
+        height=650,
+        updatemenus=[dict(
+            type='buttons',
+            buttons=[
+                dict(
+                    label='▶ 再生',
+                    method='animate',
+                    args=[None, {'frame': {'duration': 100, 'redraw': False},
+                                 'fromcurrent': True,
+                                 'transition': {'duration': 0}}]
+                ),
+                dict(
+                    label='⏸ 停止',
+                    method='animate',
+                    args=[[None], {'frame': {'duration': 0, 'redraw': False},
+                                   'mode': 'immediate',
+                                   'transition': {'duration': 0}}]
+                )
+            ]
+        )],
+        sliders=[dict(
+            steps=steps,
+            transition=dict(duration=0),
+            currentvalue=dict(visible=False)
+        )]
+    )
+
+    return fig
+
+
+def build_animation_json(frames_arr: np.ndarray, height: float,
+                         tunnel_depth: float) -> str:
+    """
+    Build the full animation figure and serialize it in one step.
+
+    Intended to run at producer time (right after the sweep), so the
+    display path only has to deserialize the cached string instead of
+    redoing geometry math, styling, and JSON encoding on every rerun.
+
+    Args:
+        frames_arr: FRAME_DTYPE structured array, one record per candidate
+        height: Tunnel face height H [m]
+        tunnel_depth: Tunnel crown depth D_t [m]
+
+    Returns:
+        JSON string for pio.from_json / st.plotly_chart
+    """
+    fig = create_slip_surface_animation(frames_arr, height, tunnel_depth)
+    return pio.to_json(fig)
+
+
+def render_slip_surface_animation(fig: go.Figure, height: int = 650) -> None:
+    """
+    Render the animation as a standalone Plotly HTML component.
+
+    Going through st.plotly_chart would route every slider drag back
+    through the Streamlit backend; embedding the figure's own HTML lets
+    the browser drive all frame transitions natively.
+
+    Args:
+        fig: Figure produced by create_slip_surface_animation
+        height: Component height in pixels
+    """
+    components.html(
+        fig.to_html(include_plotlyjs='cdn', full_html=False, auto_play=False),
+        height=height
+    )
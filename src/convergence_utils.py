@@ -1,27 +1,137 @@
 """Utilities for convergence visualization and analysis."""
 import plotly.graph_objects as go
+import plotly.io as pio
 import numpy as np
-from typing import Dict, List, Optional
+from statistics import fmean
+from typing import Dict, Optional
 import streamlit as st
 
+# orjson serializes figures several times faster than Plotly's default
+# pure-Python JSON engine; fall back silently if it is not installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
-def create_convergence_history_plot(convergence_sample: List[Dict], 
+
+def _lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices via Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: X values (monotonic)
+        y: Y values
+        n_out: Target number of output points
+
+    Returns:
+        Sorted index array of at most n_out entries (first and last
+        points always included)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo = edges[i]
+        hi = max(edges[i + 1], lo + 1)
+        # Average of the following bucket acts as the third triangle vertex
+        nlo = hi
+        nhi = max(edges[i + 2] if i + 2 < n_out - 1 else n, nlo + 1)
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+        # Pick the bucket point forming the largest triangle with the
+        # previously selected point and the next bucket's average
+        areas = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a])
+                       - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(areas.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+
+def create_convergence_plot(x_values, P_values, x_critical: float,
+                            P_max: float, max_points: int = 1000) -> go.Figure:
+    """
+    Create the P-x curve plot (required support pressure distribution).
+
+    Long sweeps are LTTB-downsampled to keep the client-side render
+    constant-time; the critical point is forced into the output so the
+    peak stays visible.
+
+    Args:
+        x_values: Slip surface start positions [m]
+        P_values: Required support pressure values [kN/m²]
+        x_critical: Critical slip surface position [m]
+        P_max: Maximum required support pressure [kN/m²]
+        max_points: Downsampling target for the line trace
+
+    Returns:
+        Plotly figure with the P-x curve and the critical point marker
+    """
+    # Contiguous ndarrays skip Plotly's element-wise list conversion
+    x = np.ascontiguousarray(x_values, dtype=np.float64)
+    P = np.ascontiguousarray(P_values, dtype=np.float64)
+
+    if len(x) > max_points:
+        indices = _lttb_downsample(x, P, max_points)
+        # Keep the peak visible regardless of bucket placement
+        critical_idx = np.abs(x - x_critical).argmin()
+        if critical_idx not in indices:
+            indices = np.sort(np.append(indices, critical_idx))
+        x = x[indices]
+        P = P[indices]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=P,
+        mode='lines',
+        name='P-x曲線',
+        line=dict(color='blue', width=2)
+    ))
+    fig.add_trace(go.Scatter(
+        x=[x_critical],
+        y=[P_max],
+        mode='markers',
+        name=f'P_max = {P_max:.1f} kN/m²',
+        marker=dict(color='red', size=12, symbol='star')
+    ))
+    fig.update_layout(
+        xaxis_title="すべり面始点位置 x (m)",
+        yaxis_title="必要支保圧力 P (kN/m²)",
+        plot_bgcolor='white',
+        hovermode='x unified',
+        uirevision='const'
+    )
+
+    return fig
+
+
+def create_convergence_history_plot(convergence_sample: Optional[np.ndarray],
                                   tolerance: float) -> go.Figure:
     """
     Create plot showing convergence history of the solver.
-    
+
     Args:
-        convergence_sample: List of convergence data from fsolve
+        convergence_sample: Structured array of convergence data
+                            (CONVERGENCE_HISTORY_DTYPE) from the solver
         tolerance: Convergence tolerance value
-        
+
     Returns:
         Plotly figure showing convergence history
     """
-    if not convergence_sample:
+    if convergence_sample is None or len(convergence_sample) == 0:
         return go.Figure()
-    
-    iterations = [d['iteration'] for d in convergence_sample]
-    errors = [d['error'] for d in convergence_sample]
+
+    iterations = np.ascontiguousarray(convergence_sample['iteration'])
+    errors = np.ascontiguousarray(convergence_sample['error'])
     
     fig = go.Figure()
     
@@ -51,27 +161,29 @@ def create_convergence_history_plot(convergence_sample: List[Dict],
         yaxis_type="log",  # Log scale for better visualization
         plot_bgcolor='white',
         hovermode='x unified',
+        uirevision='const',
         height=400
     )
     
     return fig
 
 
-def create_convergence_statistics_plot(successful_convergences: List[Dict]) -> go.Figure:
+def create_convergence_statistics_plot(successful_convergences: Optional[np.ndarray]) -> go.Figure:
     """
     Create plot showing convergence statistics across all x_i values.
-    
+
     Args:
-        successful_convergences: List of convergence data for each x_i
-        
+        successful_convergences: Structured array of convergence data
+                                 (CONVERGENCE_STATS_DTYPE) for each x_i
+
     Returns:
         Plotly figure showing convergence statistics
     """
-    if not successful_convergences:
+    if successful_convergences is None or len(successful_convergences) == 0:
         return go.Figure()
-    
-    x_values = [d['x_i'] for d in successful_convergences]
-    iterations = [d['iterations'] for d in successful_convergences]
+
+    x_values = np.ascontiguousarray(successful_convergences['x_i'])
+    iterations = np.ascontiguousarray(successful_convergences['iterations'])
     
     fig = go.Figure()
     
@@ -93,6 +205,7 @@ def create_convergence_statistics_plot(successful_convergences: List[Dict]) -> g
         xaxis_title="すべり面始点位置 x_i (m)",
         yaxis_title="収束までの反復回数",
         plot_bgcolor='white',
+        uirevision='const',
         height=400
     )
     
@@ -173,13 +286,15 @@ def create_convergence_summary_table(result) -> Dict:
         return {}
     
     conv_info = result.convergence_info
-    successful = conv_info.get('successful_convergences', [])
-    
-    if successful:
-        iterations_list = [s['iterations'] for s in successful]
-        avg_iterations = np.mean(iterations_list)
-        max_iterations = np.max(iterations_list)
-        min_iterations = np.min(iterations_list)
+    successful = conv_info.get('successful_convergences')
+
+    if successful is not None and len(successful) > 0:
+        # The sweep yields at most a few dozen entries, where builtin
+        # reductions beat NumPy's per-call dispatch overhead
+        iterations_list = successful['iterations'].tolist()
+        avg_iterations = fmean(iterations_list)
+        max_iterations = max(iterations_list)
+        min_iterations = min(iterations_list)
     else:
         avg_iterations = max_iterations = min_iterations = 0
     
@@ -1,8 +1,8 @@
 """Data models for tunnel stability analysis using Pydantic."""
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from typing import Optional, List
 from enum import Enum
-import numpy as np
+import math
 
 
 class SurchargeMethod(str, Enum):
@@ -12,10 +12,15 @@ class SurchargeMethod(str, Enum):
 
 
 class TunnelGeometry(BaseModel):
-    """Tunnel geometry parameters."""
+    """Tunnel geometry parameters.
+
+    Shared by both calculators: the improved method uses ``tunnel_depth``
+    while the classical P-B sweep uses the spiral base radius ``r0``.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
     height: float = Field(
-        gt=0, 
-        le=50, 
+        gt=0,
+        le=50,
         description="Tunnel face height H [m]"
     )
     tunnel_depth: float = Field(
@@ -24,7 +29,13 @@ class TunnelGeometry(BaseModel):
         default=10.0,
         description="Tunnel crown depth D_t [m]"
     )
-    
+    r0: Optional[float] = Field(
+        gt=0,
+        le=50,
+        default=None,
+        description="Base radius of logarithmic spiral r_0 [m]"
+    )
+
     @field_validator('height')
     def validate_height(cls, v):
         if v <= 0:
@@ -34,6 +45,7 @@ class TunnelGeometry(BaseModel):
 
 class SoilParameters(BaseModel):
     """Soil mechanical parameters."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     gamma: float = Field(
         ge=10, 
         le=30, 
@@ -50,11 +62,17 @@ class SoilParameters(BaseModel):
         description="Internal friction angle φ [degrees]"
     )
     
+    _phi_rad: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context) -> None:
+        """Cache the radian conversion; phi_rad is hit inside inner loops."""
+        self._phi_rad = math.radians(self.phi)
+
     @property
     def phi_rad(self) -> float:
-        """Convert phi to radians."""
-        return np.radians(self.phi)
-    
+        """Internal friction angle in radians (computed once)."""
+        return self._phi_rad
+
     @field_validator('phi')
     def validate_phi(cls, v):
         if not 0 <= v <= 60:
@@ -64,16 +82,24 @@ class SoilParameters(BaseModel):
 
 class LoadingConditions(BaseModel):
     """External loading conditions."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     u: float = Field(
-        ge=0, 
-        le=1000, 
-        description="Water pressure u [kPa]", 
+        ge=0,
+        le=1000,
+        description="Water pressure u [kPa]",
+        default=0
+    )
+    sigma_v: float = Field(
+        ge=0,
+        le=1000,
+        description="Vertical surcharge pressure σ_v [kPa]",
         default=0
     )
 
 
 class MurayamaInput(BaseModel):
     """Complete input parameters for Murayama analysis."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     geometry: TunnelGeometry
     soil: SoilParameters
     loading: LoadingConditions
@@ -95,6 +121,18 @@ class MurayamaInput(BaseModel):
         default=0.5,
         description="Step size for slip surface search [m]"
     )
+    max_B: float = Field(
+        gt=0,
+        le=50.0,
+        default=10.0,
+        description="Maximum sliding width for P-B sweep [m]"
+    )
+    step_B: float = Field(
+        gt=0,
+        le=2.0,
+        default=0.5,
+        description="Step size for P-B sweep [m]"
+    )
     n_divisions: int = Field(
         ge=10, 
         le=1000, 
@@ -120,11 +158,31 @@ class MurayamaInput(BaseModel):
 
 
 class MurayamaResult(BaseModel):
-    """Results from Murayama analysis."""
-    x_values: List[float] = Field(description="Slip surface start positions [m]")
+    """Results from Murayama analysis.
+
+    The improved method fills ``x_values``/``x_critical``; the classical
+    P-B sweep fills ``B_values``/``B_critical``. Unused fields keep their
+    defaults.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    x_values: List[float] = Field(
+        default_factory=list,
+        description="Slip surface start positions [m]"
+    )
+    B_values: List[float] = Field(
+        default_factory=list,
+        description="Sliding width values [m]"
+    )
     P_values: List[float] = Field(description="Required support pressure values [kN/m²]")
     P_max: float = Field(description="Maximum required support pressure [kN/m²]")
-    x_critical: float = Field(description="Critical slip surface position [m]")
+    x_critical: float = Field(
+        default=0.0,
+        description="Critical slip surface position [m]"
+    )
+    B_critical: float = Field(
+        default=0.0,
+        description="Critical sliding width [m]"
+    )
     critical_slip_surface: dict = Field(
         description="Critical slip surface geometry",
         default_factory=dict
@@ -137,16 +195,11 @@ class MurayamaResult(BaseModel):
         default=None,
         description="Information about calculation convergence"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            list: lambda v: [round(x, 3) for x in v] if v else []
-        }
 
 
 class DesignPreset(BaseModel):
     """Preset parameters for common soil types."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     name: str = Field(description="Preset name")
     description: str = Field(description="Description of soil type")
     soil: SoilParameters
@@ -1,7 +1,95 @@
 """Murayama method calculation engine for tunnel face stability analysis."""
+import functools
+import math
 import numpy as np
 from typing import Tuple, Optional
-from src.models import MurayamaInput, MurayamaResult
+from src.models import (
+    DesignPreset,
+    LoadingConditions,
+    MurayamaInput,
+    MurayamaResult,
+    SoilParameters,
+    TunnelGeometry,
+)
+
+try:
+    from numba import njit as _njit
+except ImportError:  # Numba is optional; kernels run as plain Python
+    _njit = None
+
+
+def _maybe_njit(func):
+    """JIT-compile a pure-numeric kernel when Numba is available.
+
+    ``cache=True`` persists the compiled machine code on disk, so the
+    first sweep after a restart skips the ~1s JIT warm-up.
+    """
+    if _njit is None:
+        return func
+    return _njit(fastmath=True, cache=True)(func)
+
+
+# 10-point Gauss-Legendre rule, precomputed at import. Plenty for the
+# smooth spiral integrands here; avoids quad's adaptive callback overhead
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(10)
+
+
+def _gauss_integrate(integrand, a: float, b: float) -> float:
+    """
+    Integrate a smooth vectorized integrand over [a, b].
+
+    Fixed 10-point Gauss-Legendre: the integrand is evaluated once on
+    the mapped node vector, so there is no per-node Python call. Used
+    for spiral integrals that lack a closed form (non-constant pressure
+    distributions along the arc); the plain friction moment keeps its
+    exact closed-form expression.
+
+    Args:
+        integrand: Callable accepting an ndarray of angles
+        a: Lower integration bound
+        b: Upper integration bound
+
+    Returns:
+        Approximate integral value
+    """
+    mid = 0.5 * (a + b)
+    half = 0.5 * (b - a)
+    return half * float(np.sum(_GL_WEIGHTS * integrand(mid + half * _GL_NODES)))
+
+
+@_maybe_njit
+def _theta_0_kernel(H: float, r0: float, tphi: float,
+                    tol: float, maxit: int) -> float:
+    """Newton solve for theta_0 (math.* scalars so Numba can lower it)."""
+    theta = 0.1  # Initial guess
+    for _ in range(maxit):
+        e = math.exp(theta * tphi)
+        s = math.sin(theta)
+        cs = math.cos(theta)
+        f = r0 * (e - 1.0) * cs - H / 2.0
+        df = r0 * (e * tphi * cs - e * s + s)
+        theta_new = theta - f / df
+        if abs(theta_new - theta) < tol:
+            return theta_new
+        theta = theta_new
+    return theta
+
+
+@functools.lru_cache(maxsize=64)
+def _calc_curve_cached(key: tuple) -> MurayamaResult:
+    """Memoized P-B sweep keyed on the scalar parameters it reads."""
+    (H, r0, gamma, c, phi, u, sigma_v,
+     step_B, max_B, tolerance, max_iterations) = key
+    params = MurayamaInput(
+        geometry=TunnelGeometry(height=H, r0=r0),
+        soil=SoilParameters(gamma=gamma, c=c, phi=phi),
+        loading=LoadingConditions(u=u, sigma_v=sigma_v),
+        step_B=step_B,
+        max_B=max_B,
+        tolerance=tolerance,
+        max_iterations=max_iterations
+    )
+    return MurayamaCalculator(params)._calculate_curve()
 
 
 class MurayamaCalculator:
@@ -9,146 +97,168 @@ class MurayamaCalculator:
     
     def __init__(self, params: MurayamaInput):
         """Initialize calculator with input parameters."""
+        # r0 is Optional on the shared geometry model (the improved
+        # method does not use it), but the classical P-B sweep cannot
+        # run without it — fail loudly instead of deep in the math
+        if params.geometry.r0 is None:
+            raise ValueError(
+                "MurayamaCalculator requires geometry.r0 (base radius of "
+                "the logarithmic spiral)"
+            )
         self.params = params
         self.g = 9.81  # Gravitational acceleration [m/s²]
-        
+        # phi is fixed per input; precompute its trig once
+        self._tphi = math.tan(params.soil.phi_rad)
+        self._cphi = math.cos(params.soil.phi_rad)
+
     def calculate_curve(self) -> MurayamaResult:
         """
         Calculate P-B curve using Murayama's method.
-        
+
+        Repeated calls with identical parameters (e.g. Streamlit reruns)
+        are served from a module-level cache; results are frozen models,
+        so sharing one instance between callers is safe.
+
         Returns:
             MurayamaResult containing B values, P values, and critical values
         """
-        B_values = []
-        P_values = []
-        
-        # Iterate through sliding width values
+        p = self.params
+        key = (
+            p.geometry.height, p.geometry.r0,
+            p.soil.gamma, p.soil.c, p.soil.phi,
+            p.loading.u, p.loading.sigma_v,
+            p.step_B, p.max_B, p.tolerance, p.max_iterations
+        )
+        return _calc_curve_cached(key)
+
+    def _calculate_curve(self) -> MurayamaResult:
+        """Run the full P-B sweep (uncached)."""
+        # Sweep all sliding width values in one vectorized pass
         B_range = np.arange(
-            self.params.step_B, 
-            self.params.max_B + self.params.step_B, 
+            self.params.step_B,
+            self.params.max_B + self.params.step_B,
             self.params.step_B
         )
-        
-        for B in B_range:
-            P = self._calculate_resistance(B)
-            if P is not None and P > 0:
-                B_values.append(B)
-                P_values.append(P)
-        
-        # Find maximum resistance
-        if P_values:
-            P_max = max(P_values)
-            max_index = P_values.index(P_max)
-            B_critical = B_values[max_index]
+
+        P = self._calculate_resistance(B_range)
+
+        # Find maximum resistance on the full grid (invalid entries are
+        # masked to -inf so argmax needs no filtered copy)
+        if P is not None:
+            valid = np.isfinite(P) & (P > 0)
+            B_values = B_range[valid]
+            P_values = P[valid]
+        else:
+            valid = None
+            B_values = np.empty(0)
+            P_values = np.empty(0)
+
+        if valid is not None and valid.any():
+            max_index = int(np.argmax(np.where(valid, P, -np.inf)))
+            P_max = float(P[max_index])
+            B_critical = float(B_range[max_index])
         else:
             P_max = 0
             B_critical = 0
-        
+
         # Calculate safety factor if external load is provided
         safety_factor = self._calculate_safety_factor(P_max)
-        
+
         return MurayamaResult(
-            B_values=B_values,
-            P_values=P_values,
+            B_values=B_values.tolist(),
+            P_values=P_values.tolist(),
             P_max=P_max,
             B_critical=B_critical,
             safety_factor=safety_factor
         )
-    
-    def _calculate_resistance(self, B: float) -> Optional[float]:
+
+    def _calculate_resistance(self, B: np.ndarray) -> Optional[np.ndarray]:
         """
-        Calculate resistance force P for given sliding width B.
-        
+        Calculate resistance forces P for an array of sliding widths B.
+
         Args:
-            B: Sliding width [m]
-            
+            B: Sliding widths [m]
+
         Returns:
-            Resistance force P [kN/m] or None if calculation fails
+            Resistance forces P [kN/m] or None if calculation fails
         """
-        try:
-            # Get parameters
-            H = self.params.geometry.height
-            r0 = self.params.geometry.r0
-            gamma = self.params.soil.gamma
-            c = self.params.soil.c
-            phi_rad = self.params.soil.phi_rad
-            u = self.params.loading.u
-            sigma_v = self.params.loading.sigma_v
-            
-            # Calculate angles
+        # Hoist parameters once; the rest is array arithmetic
+        H = self.params.geometry.height
+        r0 = self.params.geometry.r0
+        gamma = self.params.soil.gamma
+        c = self.params.soil.c
+        phi_rad = self.params.soil.phi_rad
+        u = self.params.loading.u
+        sigma_v = self.params.loading.sigma_v
+
+        # NaN/Inf propagate through the array math and are masked out by
+        # the caller; no per-element exception handling needed
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Calculate angles (theta_0 is scalar, theta_1 per width)
             theta_0 = self._calculate_theta_0(H, r0, phi_rad)
-            theta_1 = self._calculate_theta_1(B, r0, phi_rad, theta_0)
-            
-            if theta_0 is None or theta_1 is None:
+            if theta_0 is None:
                 return None
-            
+            theta_1 = self._calculate_theta_1(B, r0, phi_rad, theta_0)
+
             # Calculate sliding mass weight
             W_f = self._calculate_weight(H, B, r0, gamma, phi_rad, theta_0, theta_1)
-            
+
             # Calculate moment arms
             l_w = self._calculate_moment_arm_weight(H, B, r0, phi_rad, theta_0, theta_1)
             l_p = self._calculate_moment_arm_resistance(H, r0, phi_rad, theta_0)
-            
+
             # Calculate friction moment
             friction_moment = self._calculate_friction_moment(r0, c, phi_rad, theta_0, theta_1)
-            
+
             # Calculate water pressure effect
             water_effect = self._calculate_water_pressure_effect(u, H, B, l_w)
-            
+
             # Calculate surcharge effect
             surcharge_effect = sigma_v * B * l_w
-            
-            # Calculate resistance force P using moment equilibrium
+
+            # Calculate resistance forces P using moment equilibrium
             if l_p > 0:
                 P = (W_f * l_w + friction_moment - water_effect + surcharge_effect) / l_p
-                return max(0, P)  # Ensure non-negative
-            else:
-                return None
-                
-        except Exception as e:
-            print(f"Calculation error for B={B}: {e}")
+                return np.maximum(0, P)  # Ensure non-negative
             return None
     
     def _calculate_theta_0(self, H: float, r0: float, phi_rad: float) -> Optional[float]:
         """Calculate initial angle theta_0."""
-        try:
-            if phi_rad == 0:
-                return np.arcsin(H / (2 * r0))
-            else:
-                # Iterative solution for theta_0
-                theta = 0.1  # Initial guess
-                for _ in range(self.params.max_iterations):
-                    f = r0 * (np.exp(theta * np.tan(phi_rad)) - 1) * np.cos(theta) - H / 2
-                    df = r0 * (np.exp(theta * np.tan(phi_rad)) * np.tan(phi_rad) * np.cos(theta) 
-                              - np.exp(theta * np.tan(phi_rad)) * np.sin(theta) + np.sin(theta))
-                    theta_new = theta - f / df
-                    if abs(theta_new - theta) < self.params.tolerance:
-                        return theta_new
-                    theta = theta_new
-                return theta
-        except:
-            return None
-    
-    def _calculate_theta_1(self, B: float, r0: float, phi_rad: float, theta_0: float) -> Optional[float]:
-        """Calculate terminal angle theta_1."""
-        try:
-            if phi_rad == 0:
-                return np.arcsin((B + r0 * np.sin(theta_0)) / r0)
-            else:
-                # Iterative solution for theta_1
-                theta = theta_0 + 0.5  # Initial guess
-                for _ in range(self.params.max_iterations):
-                    r_theta = r0 * np.exp(theta * np.tan(phi_rad))
-                    r_theta_0 = r0 * np.exp(theta_0 * np.tan(phi_rad))
-                    f = r_theta * np.sin(theta) - r_theta_0 * np.sin(theta_0) - B
-                    df = r_theta * (np.tan(phi_rad) * np.sin(theta) + np.cos(theta))
-                    theta_new = theta - f / df
-                    if abs(theta_new - theta) < self.params.tolerance:
-                        return theta_new
-                    theta = theta_new
-                return theta
-        except:
-            return None
+        if phi_rad == 0:
+            ratio = H / (2 * r0)
+            if abs(ratio) > 1:  # Face taller than the circular arc allows
+                return None
+            return math.asin(ratio)
+        return _theta_0_kernel(
+            H, r0, self._tphi,
+            self.params.tolerance, self.params.max_iterations
+        )
+
+    def _calculate_theta_1(self, B: np.ndarray, r0: float, phi_rad: float,
+                           theta_0: float) -> np.ndarray:
+        """Calculate terminal angles theta_1 for all widths B at once.
+
+        Out-of-range widths yield NaN entries (under the caller's
+        errstate) that the validity mask drops later.
+        """
+        if phi_rad == 0:
+            return np.arcsin((B + r0 * np.sin(theta_0)) / r0)
+        # Batched Newton: one iteration advances every width at once;
+        # loop-invariant terms are hoisted outside
+        t = self._tphi
+        tolerance = self.params.tolerance
+        offset = r0 * np.exp(theta_0 * t) * np.sin(theta_0)
+        theta = np.full_like(B, theta_0 + 0.5)  # Initial guess
+        for _ in range(self.params.max_iterations):
+            r_theta = r0 * np.exp(theta * t)
+            s = np.sin(theta)
+            f = r_theta * s - offset - B
+            df = r_theta * (t * s + np.cos(theta))
+            delta = f / df
+            theta -= delta
+            if np.max(np.abs(delta)) < tolerance:
+                break
+        return theta
     
     def _calculate_weight(self, H: float, B: float, r0: float, gamma: float, 
                          phi_rad: float, theta_0: float, theta_1: float) -> float:
@@ -177,11 +287,12 @@ class MurayamaCalculator:
             arc_length = r0 * (theta_1 - theta_0)
             return c * r0 * arc_length
         else:
-            # Integration of friction along logarithmic spiral
-            integral = r0**2 * c / np.tan(phi_rad) * \
-                      (np.exp(2 * theta_1 * np.tan(phi_rad)) - 
-                       np.exp(2 * theta_0 * np.tan(phi_rad))) / 2
-            return integral * np.cos(phi_rad)
+            # Closed form of the friction integral along the log spiral;
+            # exact for constant cohesion (see _gauss_integrate otherwise)
+            t = self._tphi
+            integral = r0**2 * c / t * \
+                      (np.exp(2 * theta_1 * t) - np.exp(2 * theta_0 * t)) / 2
+            return integral * self._cphi
     
     def _calculate_water_pressure_effect(self, u: float, H: float, B: float, l_w: float) -> float:
         """Calculate water pressure effect on stability."""
@@ -199,45 +310,28 @@ class MurayamaCalculator:
         return None
 
 
+# Preset definitions: (name, description, gamma, c, phi). Models are
+# built once at import so UI reruns skip the Pydantic validation cost
+_PRESET_TABLE = [
+    ("砂質土（密）", "Dense sand", 20.0, 0.0, 35.0),
+    ("砂質土（緩）", "Loose sand", 18.0, 0.0, 30.0),
+    ("粘性土（硬）", "Stiff clay", 19.0, 50.0, 0.0),
+    ("粘性土（軟）", "Soft clay", 17.0, 25.0, 0.0),
+    ("砂礫", "Sandy gravel", 21.0, 0.0, 40.0),
+    ("シルト質砂", "Silty sand", 19.0, 10.0, 28.0),
+]
+
+_DEFAULT_PRESETS = tuple(
+    DesignPreset(
+        name=name,
+        description=description,
+        soil=SoilParameters(gamma=gamma, c=c, phi=phi),
+        typical_loading=LoadingConditions(u=0, sigma_v=0)
+    )
+    for name, description, gamma, c, phi in _PRESET_TABLE
+)
+
+
 def get_default_presets():
     """Get default soil parameter presets."""
-    from src.models import DesignPreset, SoilParameters, LoadingConditions
-    
-    return [
-        DesignPreset(
-            name="砂質土（密）",
-            description="Dense sand",
-            soil=SoilParameters(gamma=20.0, c=0.0, phi=35.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        ),
-        DesignPreset(
-            name="砂質土（緩）",
-            description="Loose sand",
-            soil=SoilParameters(gamma=18.0, c=0.0, phi=30.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        ),
-        DesignPreset(
-            name="粘性土（硬）",
-            description="Stiff clay",
-            soil=SoilParameters(gamma=19.0, c=50.0, phi=0.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        ),
-        DesignPreset(
-            name="粘性土（軟）",
-            description="Soft clay",
-            soil=SoilParameters(gamma=17.0, c=25.0, phi=0.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        ),
-        DesignPreset(
-            name="砂礫",
-            description="Sandy gravel",
-            soil=SoilParameters(gamma=21.0, c=0.0, phi=40.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        ),
-        DesignPreset(
-            name="シルト質砂",
-            description="Silty sand",
-            soil=SoilParameters(gamma=19.0, c=10.0, phi=28.0),
-            typical_loading=LoadingConditions(u=0, sigma_v=0)
-        )
-    ]
\ No newline at end of file
+    return _DEFAULT_PRESETS
\ No newline at end of file
@@ -1,11 +1,79 @@
 """Improved Murayama method calculation engine based on gemini specification."""
+import math
 import numpy as np
-from scipy.optimize import fsolve, minimize_scalar, OptimizeResult
-from scipy.integrate import quad
+from dataclasses import dataclass
 from typing import Tuple, Dict, Optional
 from src.models import MurayamaInput, MurayamaResult, SurchargeMethod
 
 
+# Structured layouts for convergence tracking (SoA, consumed directly by
+# the plot utilities without per-element dict lookups)
+CONVERGENCE_HISTORY_DTYPE = np.dtype([('iteration', 'i4'), ('error', 'f8')])
+CONVERGENCE_STATS_DTYPE = np.dtype([
+    ('x_i', 'f8'), ('iterations', 'i4'), ('final_error', 'f8')
+])
+
+# Struct-of-arrays layout for animation frames: one record per accepted
+# slip surface, consumed by src.animation_utils via column slicing
+FRAME_DTYPE = np.dtype([
+    ('x_i', 'f8'), ('P', 'f8'), ('is_crit', '?'),
+    ('theta_i', 'f8'), ('theta_d', 'f8'),
+    ('r_i', 'f8'), ('r_d', 'f8'),
+    ('Ox', 'f8'), ('Oy', 'f8')
+])
+
+
+@dataclass
+class GeometryBatch:
+    """Struct-of-arrays slip surface geometry for a whole x sweep.
+
+    Per-point quantities are float64 arrays of length len(x_range);
+    theta_i/theta_d are scalars because the center-line construction
+    fixes both angles independently of x_i. Downstream force and
+    pressure calculations operate on the arrays directly.
+    """
+    x_i: np.ndarray
+    O_x: np.ndarray
+    O_y: np.ndarray
+    r_i: np.ndarray
+    r_d: np.ndarray
+    theta_i: float
+    theta_d: float
+    valid: np.ndarray
+    history: np.ndarray
+    iterations: int
+
+
+def _build_animation_frames(geo: 'GeometryBatch', P: np.ndarray,
+                            ok: np.ndarray, critical_index: int) -> np.ndarray:
+    """Pack the accepted sweep points into a FRAME_DTYPE array.
+
+    Column assignments over the masked batch arrays; no per-frame dicts
+    are materialized. ``critical_index`` indexes the full sweep grid
+    (-1 when no point was accepted).
+
+    Args:
+        geo: GeometryBatch from _determine_geometries
+        P: Support pressure array over the full sweep grid
+        ok: Acceptance mask (valid geometry, finite positive P)
+        critical_index: Grid index of the argmax winner, or -1
+
+    Returns:
+        Structured array of shape (N,) with FRAME_DTYPE layout
+    """
+    frames = np.empty(int(np.count_nonzero(ok)), dtype=FRAME_DTYPE)
+    frames['x_i'] = geo.x_i[ok]
+    frames['P'] = P[ok]
+    frames['is_crit'] = np.flatnonzero(ok) == critical_index
+    frames['theta_i'] = geo.theta_i
+    frames['theta_d'] = geo.theta_d
+    frames['r_i'] = geo.r_i[ok]
+    frames['r_d'] = geo.r_d[ok]
+    frames['Ox'] = geo.O_x[ok]
+    frames['Oy'] = geo.O_y[ok]
+    return frames
+
+
 class ImprovedMurayamaCalculator:
     """Calculator for improved Murayama's tunnel face stability method."""
     
@@ -13,400 +81,357 @@ class ImprovedMurayamaCalculator:
         """Initialize calculator with input parameters."""
         self.params = params
         self.g = 9.81  # Gravitational acceleration [m/s²]
-        
+        # phi is fixed per input; precompute its trig once
+        phi_rad = params.soil.phi_rad
+        self._tphi = math.tan(phi_rad)
+        self._K = math.tan(math.pi / 4 - phi_rad / 2) ** 2
+        # Terzaghi denominator 2K·tan(δ) with δ = φ; when it degenerates
+        # (φ ≈ 0) the surcharge falls back to the simple overburden
+        # weight — decided once here, not per sweep point
+        self._terzaghi_denom = 2 * self._K * self._tphi
+        self._use_simple_surcharge = abs(self._terzaghi_denom) < 1e-10
+
     def calculate_stability(self, progress_callback=None, store_convergence_sample=False) -> MurayamaResult:
         """
         Calculate required support pressure using improved Murayama method.
-        
+
+        The whole x sweep runs as array expressions over a GeometryBatch;
+        the critical slip surface dict is materialized only for the
+        argmax winner.
+
         Args:
-            progress_callback: Optional callback function for progress updates
-                              callback(x_i, geometry, P, is_critical)
-        
+            progress_callback: Optional callback function for progress
+                              updates; the vectorized sweep reports once
+                              on completion rather than per point
+
         Returns:
             MurayamaResult containing x values, P values, and critical values
         """
-        x_values = []
-        P_values = []
         P_max = 0
         x_critical = 0
         critical_slip_surface = {}
-        convergence_failures = 0
         convergence_sample = None
-        successful_convergences = []
-        
-        # Get parameters
-        H = self.params.geometry.height
-        D_t = self.params.geometry.tunnel_depth
-        phi_rad = self.params.soil.phi_rad
-        c = self.params.soil.c
-        gamma = self.params.soil.gamma
-        
-        # Loop through slip surface start positions
-        x_range = np.arange(
-            self.params.x_start,
-            self.params.x_end + self.params.x_step,
-            self.params.x_step
+
+        # Unpack parameters into locals once; helpers receive them
+        # explicitly instead of chasing self.params.* chains
+        p = self.params
+        H = p.geometry.height
+        D_t = p.geometry.tunnel_depth
+        phi_rad = p.soil.phi_rad
+        c = p.soil.c
+        gamma = p.soil.gamma
+
+        # Slip surface start positions
+        x_range = np.arange(p.x_start, p.x_end + p.x_step, p.x_step)
+
+        # Step 2: Determine geometric shapes — one batched Newton solve
+        # advances the whole r_i vector per iteration
+        geo = self._determine_geometries(x_range, H, D_t, phi_rad)
+        if store_convergence_sample and len(geo.history) > 0:
+            convergence_sample = geo.history
+
+        # Steps 3-4: Forces and required support pressure, array-wide
+        forces = self._calculate_forces(geo, gamma, c, phi_rad, D_t)
+        P = self._calculate_support_pressure(geo, forces, c, phi_rad)
+
+        ok = geo.valid & np.isfinite(P) & (P > 0)
+        convergence_failures = int(np.count_nonzero(~geo.valid))
+        x_values = x_range[ok]
+        P_values = P[ok]
+        n_ok = int(x_values.size)
+
+        # Step 5: Critical surface = argmax over the accepted points;
+        # only the winner is expanded into a per-point dict
+        win = -1
+        if n_ok > 0:
+            win = int(np.argmax(np.where(ok, P, -np.inf)))
+            P_max = float(P[win])
+            x_critical = float(x_range[win])
+            critical_slip_surface = self._materialize_geometry(geo, win, H, D_t)
+
+        # Per-point convergence statistics (shared Newton iteration
+        # count; the batch converges as one system)
+        successful_convergences = np.empty(n_ok, dtype=CONVERGENCE_STATS_DTYPE)
+        successful_convergences['x_i'] = x_values
+        successful_convergences['iterations'] = geo.iterations
+        successful_convergences['final_error'] = (
+            geo.history['error'][-1] if len(geo.history) > 0 else 0.0
         )
-        
-        for idx, x_i in enumerate(x_range):
-            # Progress callback for status update
-            if progress_callback:
-                progress = (idx + 1) / len(x_range)
-                progress_callback({
-                    'progress': progress,
-                    'x_i': x_i,
-                    'status': 'calculating',
-                    'successful': len(x_values),
-                    'failed': convergence_failures
-                })
-            
-            # Step 2: Determine geometric shape
-            # Store convergence history for first point only
-            store_conv = store_convergence_sample and idx == 0
-            geometry = self._determine_geometry(x_i, H, D_t, phi_rad, store_convergence=store_conv)
-            
-            if geometry is None or (isinstance(geometry, dict) and not geometry.get('converged', True)):
-                convergence_failures += 1
-                if store_conv and isinstance(geometry, dict):
-                    convergence_sample = geometry.get('history', [])
-                continue
-                
-            # Step 3: Calculate forces
-            forces = self._calculate_forces(geometry, gamma, c, phi_rad, D_t)
-            
-            # Step 4: Calculate required support pressure P
-            P = self._calculate_support_pressure(geometry, forces, c, phi_rad)
-            
-            if P is not None and P > 0:
-                x_values.append(x_i)
-                P_values.append(P)
-                
-                # Step 5: Update maximum
-                is_critical = False
-                if P > P_max:
-                    P_max = P
-                    x_critical = x_i
-                    critical_slip_surface = geometry
-                    is_critical = True
-                
-                # Store convergence sample if this is the first successful point
-                if store_conv and geometry.get('convergence_history'):
-                    convergence_sample = geometry['convergence_history']
-                
-                # Track successful convergences
-                if geometry.get('convergence_history'):
-                    successful_convergences.append({
-                        'x_i': x_i,
-                        'iterations': len(geometry['convergence_history']),
-                        'final_error': geometry['convergence_history'][-1]['error'] if geometry['convergence_history'] else 0
-                    })
-        
+
+        if progress_callback:
+            progress_callback({
+                'progress': 1.0,
+                'x_i': x_critical,
+                'status': 'calculating',
+                'successful': n_ok,
+                'failed': convergence_failures
+            })
+
         # Calculate safety factor if needed
         safety_factor = self._calculate_safety_factor(P_max)
-        
+
         # Prepare convergence information
         convergence_info = {
             "total_points": len(x_range),
-            "successful_points": len(x_values),
+            "successful_points": n_ok,
             "convergence_failures": convergence_failures,
-            "convergence_rate": len(x_values) / len(x_range) * 100 if len(x_range) > 0 else 0
+            "convergence_rate": n_ok / len(x_range) * 100 if len(x_range) > 0 else 0
         }
-        
+
         # Add convergence details
         convergence_info['convergence_sample'] = convergence_sample
         convergence_info['successful_convergences'] = successful_convergences
-        
+        convergence_info['animation_frames'] = _build_animation_frames(
+            geo, P, ok, win
+        )
+
         return MurayamaResult(
-            x_values=x_values,
-            P_values=P_values,
+            x_values=x_values.tolist(),
+            P_values=P_values.tolist(),
             P_max=P_max,
             x_critical=x_critical,
             critical_slip_surface=critical_slip_surface,
             safety_factor=safety_factor,
             convergence_info=convergence_info
         )
+
+    @staticmethod
+    def _materialize_geometry(geo: 'GeometryBatch', idx: int,
+                              H: float, D_t: float) -> Dict:
+        """Expand one batch entry into the per-point geometry dict."""
+        x_i = float(geo.x_i[idx])
+        return {
+            'x_i': x_i,
+            'center': {'x': float(geo.O_x[idx]), 'y': float(geo.O_y[idx])},
+            'r_i': float(geo.r_i[idx]),
+            'r_d': float(geo.r_d[idx]),
+            'theta_i': geo.theta_i,
+            'theta_d': geo.theta_d,
+            'i': {'x': x_i, 'y': D_t + H}
+        }
     
-    def _determine_geometry(self, x_i: float, H: float, D_t: float, phi_rad: float, 
-                           store_convergence: bool = False) -> Optional[Dict]:
+    def _determine_geometries(self, x_arr: np.ndarray, H: float, D_t: float,
+                              phi_rad: float) -> GeometryBatch:
         """
-        Determine logarithmic spiral geometry for given slip surface start point.
-        
+        Determine logarithmic spiral geometry for all start points at once.
+
+        The center O lies on the line through the start point i at angle
+        (180° - φ) from horizontal, which fixes the polar angle of i at
+        theta_i = π - φ and leaves the start radius r_i as the single
+        unknown per start point. With the quarter-turn closure
+        theta_d = theta_i - π/2, the spiral relation gives
+        r_d = r_i·exp(-π/2·tanφ), and the remaining condition — the slip
+        surface must end on y = D_t — is one residual g(r_i) solved by a
+        batched Newton iteration that advances the whole r_i vector per
+        step. This replaces the previous per-x_i 4-equation fsolve,
+        whose fourth equation did not involve the unknowns and prevented
+        convergence away from φ = 30°.
+
         Args:
-            x_i: Horizontal distance from tunnel center to slip surface start
+            x_arr: Horizontal distances from tunnel center to slip surface starts
             H: Tunnel height
             D_t: Tunnel depth
             phi_rad: Friction angle in radians
-            
+
         Returns:
-            Dictionary containing geometric parameters or None if failed
+            GeometryBatch with per-point arrays (r_i, r_d, O_x, O_y),
+            scalar angles (theta_i, theta_d), a validity mask, the
+            iteration history and the iteration count
         """
-        try:
-            # Slip surface start point i
-            i_x = x_i
-            i_y = D_t + H
-            
-            # Initial guess for center O
-            # Center is on line through i with angle (180° - φ) from horizontal
-            angle = np.pi - phi_rad
-            
-            # Define equations to solve for center O and radii
-            def equations(vars):
-                O_x, O_y, r_i, r_d = vars
-                
-                # Condition 1: Center O is on line through i
-                eq1 = (O_y - i_y) - np.tan(angle) * (O_x - i_x)
-                
-                # Condition 2: Angle at bottom intersection
-                # δ = 45° - φ/2 at point d where slip surface meets y = D_t
-                delta = np.pi/4 - phi_rad/2
-                
-                # Point d is at y = D_t
-                # For logarithmic spiral, need to find theta values
-                theta_i = np.arctan2(i_y - O_y, i_x - O_x)
-                
-                # Logarithmic spiral equation: r = r_0 * exp(theta * tan(phi))
-                # r_i = r_0 * exp(theta_i * tan(phi))
-                # r_d = r_0 * exp(theta_d * tan(phi))
-                
-                # From geometry, find theta_d such that y = D_t
-                # This requires iterative solution
-                
-                # Simplified approach for initial implementation
-                # Assume slip surface ends at tunnel bottom
-                d_y = D_t
-                theta_d = theta_i - np.pi/2  # Approximate
-                
-                # Radius at point d
-                if phi_rad != 0:
-                    r_0 = r_i / np.exp(theta_i * np.tan(phi_rad))
-                    r_d_calc = r_0 * np.exp(theta_d * np.tan(phi_rad))
-                else:
-                    r_0 = r_i
-                    r_d_calc = r_d
-                
-                eq2 = r_d - r_d_calc
-                
-                # Distance from center to point i
-                eq3 = r_i - np.sqrt((i_x - O_x)**2 + (i_y - O_y)**2)
-                
-                # Angle condition at point d
-                eq4 = np.tan(delta) - np.tan(phi_rad)  # Simplified
-                
-                return [eq1, eq2, eq3, eq4]
-            
-            # Initial guess
-            O_x_init = i_x - H * np.cos(angle)
-            O_y_init = i_y - H * np.sin(angle)
-            r_i_init = H
-            r_d_init = H * 1.5
-            
-            # Store convergence history
-            convergence_history = []
-            iteration_count = 0
-            
-            def equations_with_tracking(vars):
-                nonlocal iteration_count
-                iteration_count += 1
-                residuals = equations(vars)
-                error = np.linalg.norm(residuals)
-                convergence_history.append({
-                    'iteration': iteration_count,
-                    'error': error,
-                    'variables': vars.copy()
-                })
-                return residuals
-            
-            # Solve equations with user-specified parameters
-            solution, info, ier, mesg = fsolve(
-                equations_with_tracking if store_convergence else equations, 
-                [O_x_init, O_y_init, r_i_init, r_d_init],
-                xtol=self.params.tolerance,
-                maxfev=self.params.max_iterations,
-                full_output=True
-            )
-            
-            # Check convergence
-            if ier != 1:
-                if store_convergence:
-                    return {'converged': False, 'history': convergence_history, 'message': mesg}
-                return None
-                
-            O_x, O_y, r_i, r_d = solution
-            
-            # Calculate theta values
-            theta_i = np.arctan2(i_y - O_y, i_x - O_x)
-            theta_d = np.arctan2(D_t - O_y, 0 - O_x)  # Assume d is at x=0 for now
-            
-            result = {
-                'x_i': x_i,
-                'center': {'x': O_x, 'y': O_y},
-                'r_i': r_i,
-                'r_d': r_d,
-                'theta_i': theta_i,
-                'theta_d': theta_d,
-                'i': {'x': i_x, 'y': i_y}
-            }
-            
-            if store_convergence:
-                result['convergence_history'] = convergence_history
-                result['converged'] = True
-            
-            return result
-            
-        except Exception as e:
-            return None
+        # Slip surface start points i (same elevation for every x_i)
+        i_y = D_t + H
+
+        # Center is on line through i with angle (180° - φ) from horizontal
+        angle = np.pi - phi_rad
+        theta_i = angle
+        theta_d = theta_i - np.pi / 2
+
+        tphi = self._tphi
+        spiral_ratio = math.exp(-np.pi / 2 * tphi)  # r_d / r_i
+        sin_angle = math.sin(angle)
+        sin_theta_d = math.sin(theta_d)
+
+        def residual(r_i):
+            # y-coordinates of the slip surface end points minus D_t
+            O_y = i_y - r_i * sin_angle
+            return O_y + r_i * spiral_ratio * sin_theta_d - D_t
+
+        # Analytic derivative: g is linear in r_i with constant slope
+        # dg/dr_i = spiral_ratio·sin(theta_d) - sin(angle), so the Newton
+        # step needs no finite-difference residual re-evaluations
+        dg = spiral_ratio * sin_theta_d - sin_angle
+
+        tolerance = self.params.tolerance
+        max_iterations = self.params.max_iterations
+        history = np.zeros(max_iterations, dtype=CONVERGENCE_HISTORY_DTYPE)
+        r_i = np.full(x_arr.size, float(H))  # Initial guess
+        converged = False
+        n_iter = 0
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for n_iter in range(1, max_iterations + 1):
+                g = residual(r_i)
+                err = float(np.max(np.abs(g))) if g.size else 0.0
+                history[n_iter - 1] = (n_iter, err)
+                if err < tolerance:
+                    converged = True
+                    break
+                if dg == 0:  # Degenerate geometry (phi = 0)
+                    break
+                r_i = r_i - g / dg
+                if not np.all(np.isfinite(r_i)):
+                    break
+
+        valid = converged & np.isfinite(r_i) & (r_i > 0)
+
+        O_x = x_arr - r_i * math.cos(angle)
+        O_y = i_y - r_i * sin_angle
+        r_d = r_i * spiral_ratio
+
+        return GeometryBatch(
+            x_i=x_arr,
+            O_x=O_x,
+            O_y=O_y,
+            r_i=r_i,
+            r_d=r_d,
+            theta_i=theta_i,
+            theta_d=theta_d,
+            valid=valid,
+            history=history[:n_iter],
+            iterations=n_iter
+        )
     
-    def _calculate_forces(self, geometry: Dict, gamma: float, c: float, phi_rad: float, D_t: float) -> Dict:
+    def _calculate_forces(self, geo: GeometryBatch, gamma: float, c: float,
+                          phi_rad: float, D_t: float) -> Dict:
         """
-        Calculate forces acting on the slip mass.
-        
+        Calculate forces acting on the slip masses, array-wide.
+
         Returns:
-            Dictionary containing weight W_h and surcharge load Q
+            Dictionary of per-point arrays: weight W_h, surcharge load Q,
+            centroid coordinates and area
         """
-        # Calculate area of slip mass
-        # This requires integration along the logarithmic spiral
-        # Simplified calculation for initial implementation
-        
-        # Approximate area as sector
-        r_i = geometry['r_i']
-        r_d = geometry['r_d']
-        theta_i = geometry['theta_i']
-        theta_d = geometry['theta_d']
-        
-        # Area calculation using integration
+        r_i = geo.r_i
+        r_d = geo.r_d
+        theta_i = geo.theta_i
+        theta_d = geo.theta_d
+
+        # Sector area: integrating ½r²dθ along r = r_0·exp(θ·tanφ) has the
+        # closed form r_0²/(4tanφ)·[exp(2θ_i·tanφ) - exp(2θ_d·tanφ)]
         if phi_rad != 0:
-            # For logarithmic spiral r = r_0 * exp(theta * tan(phi))
-            r_0 = r_i / np.exp(theta_i * np.tan(phi_rad))
-            
-            def integrand(theta):
-                r = r_0 * np.exp(theta * np.tan(phi_rad))
-                return 0.5 * r**2
-            
-            area, _ = quad(integrand, theta_d, theta_i)
+            t = self._tphi
+            r_0 = r_i / np.exp(theta_i * t)
+            area = r_0**2 / (4 * t) * (np.exp(2 * theta_i * t) - np.exp(2 * theta_d * t))
         else:
             # Circular arc
             area = 0.5 * r_i**2 * (theta_i - theta_d)
-        
+
         # Weight of slip mass
         W_h = area * gamma
-        
+
         # Width at surface (slip surface width)
-        B_s = abs(geometry['x_i'])
-        
-        # Surcharge load calculation based on selected method
-        if self.params.surcharge_method == SurchargeMethod.SIMPLE:
+        B_s = np.abs(geo.x_i)
+
+        # Surcharge load calculation based on selected method; the
+        # degenerate-denominator fallback was resolved in __init__
+        if (self.params.surcharge_method == SurchargeMethod.SIMPLE
+                or self._use_simple_surcharge):
             # Simple method: just the weight of overburden
             Q = B_s * D_t * gamma
         else:
             # Terzaghi's earth pressure theory
             Q = self._calculate_terzaghi_surcharge(B_s, gamma, c, phi_rad, D_t)
-        
+
         # Calculate centroids (simplified)
         # For sector, centroid is at 2/3 radius from center
         centroid_r = 2/3 * (r_i + r_d) / 2
         centroid_theta = (theta_i + theta_d) / 2
-        
-        centroid_x = geometry['center']['x'] + centroid_r * np.cos(centroid_theta)
-        centroid_y = geometry['center']['y'] + centroid_r * np.sin(centroid_theta)
-        
+
+        centroid_x = geo.O_x + centroid_r * np.cos(centroid_theta)
+        centroid_y = geo.O_y + centroid_r * np.sin(centroid_theta)
+
         return {
             'W_h': W_h,
             'Q': Q,
-            'centroid': {'x': centroid_x, 'y': centroid_y},
+            'centroid_x': centroid_x,
+            'centroid_y': centroid_y,
             'area': area
         }
-    
-    def _calculate_support_pressure(self, geometry: Dict, forces: Dict, c: float, phi_rad: float) -> Optional[float]:
+
+    def _calculate_support_pressure(self, geo: GeometryBatch, forces: Dict,
+                                    c: float, phi_rad: float) -> np.ndarray:
         """
-        Calculate required support pressure P from moment equilibrium.
+        Calculate required support pressures P from moment equilibrium.
+
+        Returns one value per sweep point; entries with a degenerate
+        moment arm come out NaN and are dropped by the caller's mask.
         """
-        try:
-            O_x = geometry['center']['x']
-            O_y = geometry['center']['y']
-            r_i = geometry['r_i']
-            r_d = geometry['r_d']
-            
-            # Moment arms
-            # Weight moment arm
-            l_w = abs(forces['centroid']['x'] - O_x)
-            
-            # Surcharge moment arm (simplified)
-            l_Q = abs(geometry['x_i'] - O_x)
-            
-            # Support pressure acts at tunnel center
-            # Assume acts at height D_t + H/2
-            P_y = self.params.geometry.tunnel_depth + self.params.geometry.height / 2
-            l_p = abs(0 - O_x)  # Horizontal distance from O to tunnel centerline
-            
-            # Driving moment
-            M_driving = forces['W_h'] * l_w + forces['Q'] * l_Q
-            
-            # Resistance moment from cohesion
-            if phi_rad != 0:
-                M_cohesion = c / (2 * np.tan(phi_rad)) * (r_i**2 - r_d**2)
-            else:
-                M_cohesion = c * r_i * (geometry['theta_i'] - geometry['theta_d'])
-            
-            # Required support pressure from moment equilibrium
-            if l_p > 0:
-                P = (M_driving - M_cohesion) / l_p
-                return max(0, P / self.params.geometry.height)  # Convert to pressure (force per unit area)
-            else:
-                return None
-                
-        except Exception as e:
-            return None
+        O_x = geo.O_x
+        r_i = geo.r_i
+        r_d = geo.r_d
+
+        # Moment arms
+        # Weight moment arm
+        l_w = np.abs(forces['centroid_x'] - O_x)
+
+        # Surcharge moment arm (simplified)
+        l_Q = np.abs(geo.x_i - O_x)
+
+        # Support pressure acts at tunnel center; horizontal distance
+        # from O to the tunnel centerline is the resisting arm
+        l_p = np.abs(O_x)
+
+        # Driving moment
+        M_driving = forces['W_h'] * l_w + forces['Q'] * l_Q
+
+        # Resistance moment from cohesion
+        if phi_rad != 0:
+            M_cohesion = c / (2 * self._tphi) * (r_i**2 - r_d**2)
+        else:
+            M_cohesion = c * r_i * (geo.theta_i - geo.theta_d)
+
+        # Required support pressure from moment equilibrium, converted to
+        # force per unit area over the face height
+        with np.errstate(divide='ignore', invalid='ignore'):
+            P = np.where(l_p > 0, (M_driving - M_cohesion) / l_p, np.nan)
+        return np.maximum(0, P / self.params.geometry.height)
     
-    def _calculate_terzaghi_surcharge(self, B_s: float, gamma: float, c: float, 
-                                     phi_rad: float, D_t: float) -> float:
+    def _calculate_terzaghi_surcharge(self, B_s, gamma: float, c: float,
+                                     phi_rad: float, D_t: float):
         """
         Calculate surcharge load using Terzaghi's earth pressure theory.
-        
+
         Args:
-            B_s: Slip surface width at ground surface [m]
+            B_s: Slip surface width at ground surface [m], scalar or array
             gamma: Unit weight [kN/m³]
             c: Cohesion [kPa]
             phi_rad: Friction angle [rad]
             D_t: Tunnel depth [m]
             
         Returns:
-            Total surcharge load Q [kN/m]
+            Total surcharge load Q [kN/m] (same shape as B_s)
         """
         # Convert cohesion to kN/m²
         c_kN = c  # Already in kPa = kN/m²
-        
-        # Side wall friction angle (assume equal to phi)
-        delta_rad = phi_rad
-        
-        # Earth pressure coefficient (Rankine's active earth pressure)
-        # K = tan²(45° - φ/2)
-        K = np.tan(np.pi/4 - phi_rad/2) ** 2
-        
-        # Check for zero denominator
-        denominator = 2 * K * np.tan(delta_rad)
-        if abs(denominator) < 1e-10:
-            # Fall back to simple method if denominator is too small
-            return B_s * D_t * gamma
-        
+
+        # Denominator 2K·tan(δ) with δ = φ and Rankine's
+        # K = tan²(45° - φ/2), both precomputed in __init__; callers
+        # route the degenerate case through the simple method
+        denominator = self._terzaghi_denom
+
         # Terzaghi's formula for vertical pressure
         # p_v = (B_s * γ - 2c) / (2K * tan(δ)) * (1 - exp(-2K * tan(δ) * D_t / B_s))
-        exponent_term = -denominator * D_t / B_s
-        
-        # Ensure numerical stability
-        if exponent_term < -20:  # exp(-20) ≈ 2e-9
-            exp_term = 0
-        else:
-            exp_term = np.exp(exponent_term)
-        
-        p_v = (B_s * gamma - 2 * c_kN) / denominator * (1 - exp_term)
-        
+        # -expm1(x) equals 1 - exp(x) without cancellation for small x and
+        # saturates cleanly for very negative x, so no clamp is needed.
+        # B_s = 0 at x_i = 0 divides to -inf, which expm1 saturates and
+        # the clip below zeroes — suppress the warning, not the math
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p_v = (B_s * gamma - 2 * c_kN) / denominator * -np.expm1(-denominator * D_t / B_s)
+
         # Ensure non-negative pressure
-        p_v = max(0, p_v)
-        
+        p_v = np.maximum(0, p_v)
+
         # Total surcharge load
-        Q = p_v * B_s
-        
-        return Q
+        return p_v * B_s
     
     def _calculate_safety_factor(self, P_max: float) -> Optional[float]:
         """Calculate safety factor if applicable."""
@@ -1,108 +1,285 @@
 """Report generation module for tunnel stability analysis results."""
+import functools
 import io
+import string
+import numpy as np
 from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT
-import plotly.graph_objects as go
-import pandas as pd
+from typing import IO
 from src.models import MurayamaInput, MurayamaResult
 
+_INPUT_HEADER_ROW = ['Parameter', 'Value', 'Unit']
+_RESULT_HEADER_ROW = ['Parameter', 'Value']
+_DATA_HEADER_ROW = ['B [m]', 'P [kN/m]']
+
+# Bound format methods; f-strings re-parse the format spec on every
+# call, these compile it once and just apply it
+_F1 = '{:.1f}'.format
+_F2 = '{:.2f}'.format
+
+# Safety assessment bands shared by the PDF and markdown paths, scanned
+# top-down for the first threshold the safety factor reaches:
+# (threshold, band key, PDF message, markdown line)
+_ASSESSMENTS = (
+    (1.5, 'safe',
+     "SAFE - The tunnel face is stable with adequate safety margin.",
+     "✅ **SAFE** - The tunnel face is stable with adequate safety margin.\n"),
+    (1.2, 'marginal',
+     "MARGINAL - The tunnel face stability is marginal. Additional support measures recommended.",
+     "⚠️ **MARGINAL** - The tunnel face stability is marginal. Additional support measures recommended.\n"),
+    (0.0, 'unsafe',
+     "UNSAFE - The tunnel face is unstable. Immediate support measures required.",
+     "❌ **UNSAFE** - The tunnel face is unstable. Immediate support measures required.\n"),
+)
+
+
+def _assess(fs: float):
+    """Return the (band, pdf_message, markdown_line) for a safety factor."""
+    return next((band, message, md_line)
+                for threshold, band, message, md_line in _ASSESSMENTS
+                if fs >= threshold)
+
+
+# Fixed markdown skeleton, parsed once; generation only substitutes the
+# pre-formatted values
+_MD_TEMPLATE = string.Template("""# Murayama Tunnel Stability Analysis Report
+
+## Analysis Date
+$date
+
+## 1. Input Parameters
+
+### Tunnel Geometry
+- Height (H): $height m
+- Tunnel depth (D_t): $depth m
+
+### Soil Parameters
+- Unit weight (γ): $gamma kN/m³
+- Cohesion (c): $c kPa
+- Friction angle (φ): $phi°
+
+### Loading Conditions
+- Water pressure (u): $u kPa
+
+## 2. Analysis Results
+
+### Key Results
+- **Maximum support pressure (P_max)**: $p_max kN/m²
+- **Critical position (x_critical)**: $x_critical m
+""")
+
+_reportlab_loaded = False
+
+
+@functools.lru_cache(maxsize=1)
+def _build_stylesheet():
+    """
+    Build the shared stylesheet with the custom styles registered.
+
+    Cached for the process lifetime: ReportLab stylesheets raise on
+    re-adding an existing style name, so registration must happen
+    exactly once no matter how the loader is reached.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1f77b4'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    ))
+    styles.add(ParagraphStyle(
+        name='CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#1f77b4'),
+        spaceAfter=12
+    ))
+    return styles
+
+
+def _load_reportlab():
+    """
+    Import ReportLab and build the shared report furniture on first use.
+
+    ReportLab is only needed on the PDF path; deferring the import (and
+    the expensive getSampleStyleSheet setup) keeps markdown-only callers
+    from paying its import cost. The symbols and prebuilt constants are
+    bound as module globals, so everything below this function uses them
+    exactly as if they had been imported at the top.
+    """
+    global _reportlab_loaded, colors, A4, cm, \
+        SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, \
+        ParagraphStyle, \
+        _BASE_STYLES, _INPUT_TABLE_STYLE, _RESULT_TABLE_STYLE, \
+        _DATA_TABLE_STYLE, _INPUT_COLS, _RESULT_COLS, _DATA_COLS, \
+        _TITLE_PARA, _SECTION_HEADINGS, _SPACER_12, _SPACER_20, \
+        _ASSESS_STYLES
+    if _reportlab_loaded:
+        return
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+    # Style setup is expensive in ReportLab (getSampleStyleSheet builds
+    # dozens of style objects), so the stylesheet and the custom
+    # additions are created once and shared by every generator instance
+    _BASE_STYLES = _build_stylesheet()
+
+    # Prebuilt table styles; TableStyle instances are immutable here and
+    # safe to reuse across tables and reports
+    _INPUT_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _RESULT_TABLE_STYLE = _INPUT_TABLE_STYLE  # Same look for both summaries
+    _DATA_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ])
+
+    # Fixed report furniture, built once and reused by every report: the
+    # data rows are the only part that varies between generations
+    _INPUT_COLS = [6*cm, 3*cm, 3*cm]
+    _RESULT_COLS = [8*cm, 4*cm]
+    _DATA_COLS = [4*cm, 4*cm]
+    _TITLE_PARA = Paragraph(
+        "Murayama Tunnel Stability Analysis Report", _BASE_STYLES['CustomTitle']
+    )
+    _SECTION_HEADINGS = {
+        'input': Paragraph("1. Input Parameters", _BASE_STYLES['CustomHeading']),
+        'results': Paragraph("2. Analysis Results", _BASE_STYLES['CustomHeading']),
+        'safety': Paragraph("3. Safety Assessment", _BASE_STYLES['CustomHeading']),
+        'data': Paragraph("4. P-B Curve Data", _BASE_STYLES['CustomHeading']),
+    }
+    _SPACER_12 = Spacer(1, 12)
+    _SPACER_20 = Spacer(1, 20)
+
+    # One colored style per assessment band instead of a fresh
+    # ParagraphStyle per report
+    _ASSESS_STYLES = {
+        band: ParagraphStyle(
+            'Assess' + band.capitalize(),
+            parent=_BASE_STYLES['Normal'],
+            textColor=color,
+            fontSize=12,
+            spaceAfter=12
+        )
+        for band, color in (('safe', colors.green),
+                            ('marginal', colors.orange),
+                            ('unsafe', colors.red))
+    }
+
+    _reportlab_loaded = True
+
 
 class ReportGenerator:
     """Generate PDF reports for Murayama analysis results."""
-    
+
     def __init__(self, input_params: MurayamaInput, result: MurayamaResult):
         """Initialize report generator."""
         self.input_params = input_params
         self.result = result
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1f77b4'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#1f77b4'),
-            spaceAfter=12
-        ))
-    
+        # One ndarray cast shared by the PDF and markdown paths; the
+        # improved method fills x_values instead of B_values, so fall
+        # back to the x sweep when no B sweep is present
+        self._Barr = np.asarray(result.B_values or result.x_values)
+        self._Parr = np.asarray(result.P_values)
+        self._nrows = self._Barr.size
+        # One strftime per report; PDF and markdown share the same stamp
+        self._timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+
     def generate_pdf(self) -> bytes:
         """Generate PDF report and return as bytes."""
         buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
-        story = []
-        
-        # Title
-        story.append(Paragraph("Murayama Tunnel Stability Analysis Report", self.styles['CustomTitle']))
-        story.append(Spacer(1, 12))
-        
+        self.generate_pdf_to(buffer)
+        return buffer.getvalue()
+
+    def generate_pdf_to(self, stream: IO[bytes]) -> None:
+        """
+        Write the PDF report directly to an open binary stream.
+
+        Avoids the intermediate BytesIO + getvalue() copy of
+        generate_pdf; callers with a file or HTTP response body can
+        stream the document without doubling peak memory.
+        """
+        _load_reportlab()
+        self.styles = _BASE_STYLES
+        doc = SimpleDocTemplate(stream, pagesize=A4)
+        doc.build(list(self._iter_story()))
+
+    def _iter_story(self):
+        """
+        Yield the report flowables section by section.
+
+        Sections are produced lazily, so only the final story list (one
+        flat materialization for doc.build) holds all flowables at once
+        — no intermediate per-section list copies accumulate.
+        """
+        # Title (prototype flowable shared across reports)
+        yield _TITLE_PARA
+        yield _SPACER_12
+
         # Date and project info
-        story.append(Paragraph(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}", self.styles['Normal']))
-        story.append(Spacer(1, 20))
-        
+        yield Paragraph(f"Analysis Date: {self._timestamp}", self.styles['Normal'])
+        yield _SPACER_20
+
         # Input parameters section
-        story.append(Paragraph("1. Input Parameters", self.styles['CustomHeading']))
-        story.extend(self._create_input_table())
-        story.append(Spacer(1, 20))
-        
+        yield _SECTION_HEADINGS['input']
+        yield from self._create_input_table()
+        yield _SPACER_20
+
         # Results section
-        story.append(Paragraph("2. Analysis Results", self.styles['CustomHeading']))
-        story.extend(self._create_results_summary())
-        story.append(Spacer(1, 20))
-        
+        yield _SECTION_HEADINGS['results']
+        yield from self._create_results_summary()
+        yield _SPACER_20
+
         # Safety assessment
-        story.append(Paragraph("3. Safety Assessment", self.styles['CustomHeading']))
-        story.extend(self._create_safety_assessment())
-        story.append(Spacer(1, 20))
-        
+        yield _SECTION_HEADINGS['safety']
+        yield from self._create_safety_assessment()
+        yield _SPACER_20
+
         # Data table
-        story.append(Paragraph("4. P-B Curve Data", self.styles['CustomHeading']))
-        story.extend(self._create_data_table())
-        
-        # Build PDF
-        doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
+        yield _SECTION_HEADINGS['data']
+        yield from self._create_data_table()
     
     def _create_input_table(self):
         """Create input parameters table."""
+        geo = self.input_params.geometry
+        soil = self.input_params.soil
+        load = self.input_params.loading
         data = [
-            ['Parameter', 'Value', 'Unit'],
-            ['Tunnel height (H)', f'{self.input_params.geometry.height:.1f}', 'm'],
-            ['Tunnel depth (D_t)', f'{self.input_params.geometry.tunnel_depth:.1f}', 'm'],
-            ['Unit weight (γ)', f'{self.input_params.soil.gamma:.1f}', 'kN/m³'],
-            ['Cohesion (c)', f'{self.input_params.soil.c:.1f}', 'kPa'],
-            ['Friction angle (φ)', f'{self.input_params.soil.phi:.1f}', '°'],
-            ['Water pressure (u)', f'{self.input_params.loading.u:.1f}', 'kPa'],
+            _INPUT_HEADER_ROW,
+            ['Tunnel height (H)', _F1(geo.height), 'm'],
+            ['Tunnel depth (D_t)', _F1(geo.tunnel_depth), 'm'],
+            ['Unit weight (γ)', _F1(soil.gamma), 'kN/m³'],
+            ['Cohesion (c)', _F1(soil.c), 'kPa'],
+            ['Friction angle (φ)', _F1(soil.phi), '°'],
+            ['Water pressure (u)', _F1(load.u), 'kPa'],
         ]
         
-        table = Table(data, colWidths=[6*cm, 3*cm, 3*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
+        table = Table(data, colWidths=_INPUT_COLS)
+        table.setStyle(_INPUT_TABLE_STYLE)
+
         return [table]
     
     def _create_results_summary(self):
@@ -110,27 +287,19 @@ class ReportGenerator:
         elements = []
         
         # Key results
+        result = self.result
         data = [
-            ['Parameter', 'Value'],
-            ['Maximum resistance (P_max)', f'{self.result.P_max:.1f} kN/m'],
-            ['Critical sliding width (B_critical)', f'{self.result.B_critical:.2f} m'],
+            _RESULT_HEADER_ROW,
+            ['Maximum resistance (P_max)', _F1(result.P_max) + ' kN/m'],
+            ['Critical sliding width (B_critical)', _F2(result.B_critical) + ' m'],
         ]
+
+        if result.safety_factor:
+            data.append(['Safety factor', _F2(result.safety_factor)])
         
-        if self.result.safety_factor:
-            data.append(['Safety factor', f'{self.result.safety_factor:.2f}'])
-        
-        table = Table(data, colWidths=[8*cm, 4*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
+        table = Table(data, colWidths=_RESULT_COLS)
+        table.setStyle(_RESULT_TABLE_STYLE)
+
         elements.append(table)
         return elements
     
@@ -140,27 +309,11 @@ class ReportGenerator:
         
         if self.result.safety_factor:
             fs = self.result.safety_factor
-            if fs >= 1.5:
-                assessment = "SAFE - The tunnel face is stable with adequate safety margin."
-                color = colors.green
-            elif fs >= 1.2:
-                assessment = "MARGINAL - The tunnel face stability is marginal. Additional support measures recommended."
-                color = colors.orange
-            else:
-                assessment = "UNSAFE - The tunnel face is unstable. Immediate support measures required."
-                color = colors.red
-            
-            para = Paragraph(f"Safety Factor: {fs:.2f}", self.styles['Normal'])
+            band, assessment, _ = _assess(fs)
+
+            para = Paragraph("Safety Factor: " + _F2(fs), self.styles['Normal'])
             elements.append(para)
-            
-            style = ParagraphStyle(
-                'Assessment',
-                parent=self.styles['Normal'],
-                textColor=color,
-                fontSize=12,
-                spaceAfter=12
-            )
-            elements.append(Paragraph(assessment, style))
+            elements.append(Paragraph(assessment, _ASSESS_STYLES[band]))
         else:
             elements.append(Paragraph(
                 "No external load specified. Safety factor cannot be calculated.",
@@ -173,91 +326,84 @@ class ReportGenerator:
         """Create P-B curve data table (showing selected points)."""
         elements = []
         
-        # Select representative points (every 5th point to keep table manageable)
-        indices = list(range(0, len(self.result.B_values), max(1, len(self.result.B_values) // 20)))
-        if len(self.result.B_values) - 1 not in indices:
-            indices.append(len(self.result.B_values) - 1)
-        
-        data = [['B [m]', 'P [kN/m]']]
-        for i in indices:
-            data.append([
-                f'{self.result.B_values[i]:.2f}',
-                f'{self.result.P_values[i]:.1f}'
-            ])
-        
-        table = Table(data, colWidths=[4*cm, 4*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ]))
-        
+        n = self._nrows
+        if n == 0:
+            return [Paragraph("No data.", self.styles['Italic'])]
+
+        # Select representative points (strided slice to keep the table
+        # manageable) and format both columns in one vectorized pass;
+        # small results are printed in full without the stride math
+        B = self._Barr
+        P = self._Parr
+        if n <= 20:
+            indices = np.arange(n)
+        else:
+            indices = np.arange(0, n, n // 20)
+            if indices[-1] != n - 1:
+                indices = np.append(indices, n - 1)
+
+        # One vectorized formatting pass per column; rows are the zipped
+        # tuples directly (ReportLab accepts any sequence per row)
+        b_strs = np.char.mod('%.2f', B[indices]).tolist()
+        p_strs = np.char.mod('%.1f', P[indices]).tolist()
+        data = [_DATA_HEADER_ROW]
+        data.extend(zip(b_strs, p_strs))
+
+        table = Table(data, colWidths=_DATA_COLS)
+        table.setStyle(_DATA_TABLE_STYLE)
+
         elements.append(table)
-        elements.append(Spacer(1, 12))
+        elements.append(_SPACER_12)
         elements.append(Paragraph(
-            f"Note: Showing {len(data)-1} representative points out of {len(self.result.B_values)} total data points.",
+            f"Note: Showing {len(data)-1} representative points out of {self._nrows} total data points.",
             self.styles['Italic']
         ))
-        
+
         return elements
 
+    def generate_markdown(self) -> str:
+        """Generate a markdown report of the analysis results."""
+        geo = self.input_params.geometry
+        soil = self.input_params.soil
+        load = self.input_params.loading
+        result = self.result
+        # Built as a list of sections joined once at the end; repeated
+        # `report += ...` re-copies the whole string on every append
+        parts = [_MD_TEMPLATE.substitute(
+            date=self._timestamp,
+            height=_F1(geo.height),
+            depth=_F1(geo.tunnel_depth),
+            gamma=_F1(soil.gamma),
+            c=_F1(soil.c),
+            phi=_F1(soil.phi),
+            u=_F1(load.u),
+            p_max=_F1(result.P_max),
+            x_critical=_F1(result.x_critical)
+        )]
 
-def generate_markdown_report(input_params: MurayamaInput, result: MurayamaResult) -> str:
-    """Generate a markdown report of the analysis results."""
-    report = f"""# Murayama Tunnel Stability Analysis Report
+        if result.safety_factor:
+            fs = result.safety_factor
+            parts.append(f"- **Safety factor**: {fs:.2f}\n")
+            parts.append("\n### Safety Assessment\n")
+            parts.append(_assess(fs)[2])
 
-## Analysis Date
-{datetime.now().strftime('%Y-%m-%d %H:%M')}
+        parts.append("\n## 3. Recommendations\n")
+        parts.append("Based on the analysis results, the following recommendations are made:\n")
 
-## 1. Input Parameters
+        if result.safety_factor and result.safety_factor < 1.5:
+            parts.append("- Consider additional support measures such as face bolting or grouting\n")
+            parts.append("- Monitor face deformation closely during excavation\n")
+            parts.append("- Review and potentially improve soil parameters through additional investigation\n")
+        else:
+            parts.append("- Continue with standard excavation procedures\n")
+            parts.append("- Maintain regular monitoring as per standard practice\n")
 
-### Tunnel Geometry
-- Height (H): {input_params.geometry.height:.1f} m
-- Tunnel depth (D_t): {input_params.geometry.tunnel_depth:.1f} m
+        parts.append("\n---\n")
+        parts.append("*Generated by Murayama Tunnel Stability Analysis System*\n")
 
-### Soil Parameters
-- Unit weight (γ): {input_params.soil.gamma:.1f} kN/m³
-- Cohesion (c): {input_params.soil.c:.1f} kPa
-- Friction angle (φ): {input_params.soil.phi:.1f}°
+        return "".join(parts)
 
-### Loading Conditions
-- Water pressure (u): {input_params.loading.u:.1f} kPa
 
-## 2. Analysis Results
-
-### Key Results
-- **Maximum support pressure (P_max)**: {result.P_max:.1f} kN/m²
-- **Critical position (x_critical)**: {result.x_critical:.1f} m
-"""
-    
-    if result.safety_factor:
-        report += f"- **Safety factor**: {result.safety_factor:.2f}\n"
-        
-        report += "\n### Safety Assessment\n"
-        if result.safety_factor >= 1.5:
-            report += "✅ **SAFE** - The tunnel face is stable with adequate safety margin.\n"
-        elif result.safety_factor >= 1.2:
-            report += "⚠️ **MARGINAL** - The tunnel face stability is marginal. Additional support measures recommended.\n"
-        else:
-            report += "❌ **UNSAFE** - The tunnel face is unstable. Immediate support measures required.\n"
-    
-    report += "\n## 3. Recommendations\n"
-    report += "Based on the analysis results, the following recommendations are made:\n"
-    
-    if result.safety_factor and result.safety_factor < 1.5:
-        report += "- Consider additional support measures such as face bolting or grouting\n"
-        report += "- Monitor face deformation closely during excavation\n"
-        report += "- Review and potentially improve soil parameters through additional investigation\n"
-    else:
-        report += "- Continue with standard excavation procedures\n"
-        report += "- Maintain regular monitoring as per standard practice\n"
-    
-    report += "\n---\n"
-    report += "*Generated by Murayama Tunnel Stability Analysis System*\n"
-    
-    return report
\ No newline at end of file
+def generate_markdown_report(input_params: MurayamaInput, result: MurayamaResult) -> str:
+    """Generate a markdown report of the analysis results."""
+    return ReportGenerator(input_params, result).generate_markdown()
\ No newline at end of file
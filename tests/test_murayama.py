@@ -2,7 +2,7 @@
 import pytest
 import numpy as np
 from src.models import TunnelGeometry, SoilParameters, LoadingConditions, MurayamaInput
-from src.murayama import MurayamaCalculator
+from src.murayama import MurayamaCalculator, _gauss_integrate
 
 
 class TestMurayamaCalculator:
@@ -28,6 +28,16 @@ class TestMurayamaCalculator:
         assert calc.params == basic_input
         assert calc.g == 9.81
     
+    def test_missing_r0_raises(self):
+        """r0 is required for the classical P-B sweep."""
+        geom = TunnelGeometry(height=10.0)  # r0 defaults to None
+        soil = SoilParameters(gamma=20.0, c=30.0, phi=30.0)
+        loading = LoadingConditions()
+        murayama = MurayamaInput(geometry=geom, soil=soil, loading=loading)
+
+        with pytest.raises(ValueError, match="r0"):
+            MurayamaCalculator(murayama)
+
     def test_calculate_curve_returns_results(self, basic_input):
         """Test that calculate_curve returns valid results."""
         calc = MurayamaCalculator(basic_input)
@@ -129,4 +139,19 @@ class TestMurayamaCalculator:
         result_wet = calc_wet.calculate_curve()
         
         # Water pressure should reduce maximum resistance
-        assert result_wet.P_max < result_dry.P_max
\ No newline at end of file
+        assert result_wet.P_max < result_dry.P_max
+
+class TestGaussIntegrate:
+    """Test the fixed Gauss-Legendre quadrature helper."""
+
+    def test_polynomial_exact(self):
+        """10-point rule is exact for low-order polynomials."""
+        result = _gauss_integrate(lambda x: 3 * x**2, 0.0, 2.0)
+        assert abs(result - 8.0) < 1e-12
+
+    def test_spiral_integrand(self):
+        """Matches the closed-form log-spiral friction integral."""
+        t = np.tan(np.radians(30.0))
+        result = _gauss_integrate(lambda th: np.exp(2 * th * t), 0.1, 1.2)
+        exact = (np.exp(2 * 1.2 * t) - np.exp(2 * 0.1 * t)) / (2 * t)
+        assert abs(result - exact) < 1e-9